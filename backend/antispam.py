@@ -0,0 +1,193 @@
+"""
+Антиспам-фильтр регистраций, работающий до обращения к MongoDB.
+
+Проверки (все в памяти процесса, без сетевых вызовов):
+1. Токен времени заполнения формы — подписанная метка времени, выданная
+   при открытии формы. Слишком быстрые, просроченные и повторно
+   использованные токены отклоняются.
+2. LRU недавно виденных пар телефон+турнир — повторная отправка того же
+   номера не доходит до find_one/insert_one.
+3. Token bucket по префиксу телефона — отсекает переборы номеров из одного
+   диапазона.
+"""
+
+import hashlib
+import hmac
+import os
+import re
+import secrets
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException
+
+from config import settings
+
+TOKEN_RE = re.compile(r"^\d{1,16}\.[0-9a-f]{8}\.[0-9a-f]{32}$")
+
+# Тексты ошибок по причине отказа токена
+TOKEN_REJECT_DETAILS = {
+    "token_missing": "Форма устарела, обновите страницу и попробуйте снова",
+    "token_invalid": "Форма устарела, обновите страницу и попробуйте снова",
+    "token_expired": "Форма устарела, обновите страницу и попробуйте снова",
+    "token_reused": "Форма уже была отправлена, попробуйте еще раз",
+    "too_fast": "Форма отправлена слишком быстро, подождите несколько секунд и попробуйте снова",
+}
+
+
+class SpamFilter:
+    """Состояние фильтра одного воркера"""
+
+    def __init__(
+        self,
+        min_fill_seconds: float = 3.0,
+        token_max_age: float = 2 * 60 * 60,
+        recent_ttl: float = 10 * 60,
+        recent_max_size: int = 50_000,
+        prefix_length: int = 8,
+        prefix_burst: int = 5,
+        prefix_refill_seconds: float = 60.0,
+        prefix_max_buckets: int = 10_000,
+        spent_nonces_max_size: int = 100_000,
+    ):
+        self.min_fill_seconds = min_fill_seconds
+        self.token_max_age = token_max_age
+        self.recent_ttl = recent_ttl
+        self.recent_max_size = recent_max_size
+        self.prefix_length = prefix_length
+        self.prefix_burst = prefix_burst
+        self.prefix_refill_seconds = prefix_refill_seconds
+        self.prefix_max_buckets = prefix_max_buckets
+        self.spent_nonces_max_size = spent_nonces_max_size
+
+        self._recent: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._spent_nonces: "OrderedDict[str, float]" = OrderedDict()
+        self.counters: Counter = Counter()
+
+    # === Токен формы ===
+
+    @staticmethod
+    def _secret() -> bytes:
+        return (settings.antispam_secret or settings.admin_sync_token).encode()
+
+    def _sign(self, payload: str) -> str:
+        return hmac.new(self._secret(), payload.encode(), hashlib.sha256).hexdigest()[:32]
+
+    def issue_token(self, now: Optional[float] = None) -> str:
+        """Выдает токен вида `<timestamp>.<nonce>.<signature>`"""
+        issued_at = int((now or time.time()) * 1000)
+        payload = f"{issued_at}.{secrets.token_hex(4)}"
+        return f"{payload}.{self._sign(payload)}"
+
+    def _check_token(self, token: Optional[str], now: float) -> Optional[str]:
+        """Возвращает причину отказа или None"""
+        if not token:
+            return "token_missing" if settings.antispam_require_form_token else None
+        if not TOKEN_RE.match(token):
+            return "token_invalid"
+        issued_at, nonce, signature = token.split(".")
+        payload = f"{issued_at}.{nonce}"
+        if not hmac.compare_digest(signature.encode(), self._sign(payload).encode()):
+            return "token_invalid"
+        age = now - int(issued_at) / 1000
+        if age < self.min_fill_seconds:
+            return "too_fast"
+        if age > self.token_max_age:
+            return "token_expired"
+        if not self._spend_nonce(payload):
+            return "token_reused"
+        return None
+
+    def _spend_nonce(self, payload: str) -> bool:
+        """Отмечает токен использованным; False если он уже был использован"""
+        now = time.monotonic()
+        # Старше token_max_age записи не нужны: такой токен отклонится как просроченный
+        while self._spent_nonces:
+            oldest, spent_at = next(iter(self._spent_nonces.items()))
+            if now - spent_at <= self.token_max_age:
+                break
+            del self._spent_nonces[oldest]
+        if payload in self._spent_nonces:
+            return False
+        self._spent_nonces[payload] = now
+        while len(self._spent_nonces) > self.spent_nonces_max_size:
+            self._spent_nonces.popitem(last=False)
+        return True
+
+    # === Недавние пары телефон+турнир ===
+
+    def _seen_recently(self, key: Tuple[str, str], now: float) -> bool:
+        seen_at = self._recent.get(key)
+        if seen_at is None:
+            return False
+        if now - seen_at > self.recent_ttl:
+            del self._recent[key]
+            return False
+        return True
+
+    def remember(self, phone: str, tournament_id: str) -> None:
+        """Запоминает пару после успешной записи или ошибки дубля"""
+        key = (phone, tournament_id)
+        self._recent[key] = time.monotonic()
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.recent_max_size:
+            self._recent.popitem(last=False)
+
+    # === Лимит по префиксу телефона ===
+
+    def _take_prefix_token(self, phone: str, now: float) -> bool:
+        prefix = phone[:self.prefix_length]
+        tokens, updated_at = self._buckets.get(prefix, (float(self.prefix_burst), now))
+        tokens = min(
+            float(self.prefix_burst),
+            tokens + (now - updated_at) / self.prefix_refill_seconds
+        )
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[prefix] = (tokens, now)
+        self._buckets.move_to_end(prefix)
+        while len(self._buckets) > self.prefix_max_buckets:
+            self._buckets.popitem(last=False)
+        return allowed
+
+    # === Пайплайн ===
+
+    def check(self, phone: str, tournament_id: str, form_token: Optional[str]) -> None:
+        """
+        Пропускает заявку дальше или выбрасывает HTTPException.
+        Вызывается до любых запросов к MongoDB.
+        """
+        self.counters["checked"] += 1
+        monotonic_now = time.monotonic()
+
+        reason = self._check_token(form_token, time.time())
+        if reason:
+            self._reject(reason, 400, TOKEN_REJECT_DETAILS[reason])
+
+        if self._seen_recently((phone, tournament_id), monotonic_now):
+            self._reject("recent_duplicate", 400, "Вы уже зарегистрированы на этот турнир")
+
+        if not self._take_prefix_token(phone, monotonic_now):
+            self._reject("prefix_rate", 429, "Слишком много заявок, попробуйте позже")
+
+        self.counters["passed"] += 1
+
+    def _reject(self, reason: str, status_code: int, detail: str) -> None:
+        self.counters[f"rejected_{reason}"] += 1
+        raise HTTPException(status_code=status_code, detail=detail)
+
+    def stats(self) -> Dict[str, int]:
+        """Счетчики для мониторинга (только текущего воркера, см. pid)"""
+        return {
+            "pid": os.getpid(),
+            **self.counters,
+            "recent_pairs": len(self._recent),
+            "prefix_buckets": len(self._buckets),
+            "spent_tokens": len(self._spent_nonces),
+        }
+
+
+spam_filter = SpamFilter()
@@ -14,6 +14,16 @@ class Settings(BaseSettings):
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    workers: int = 0  # 0 — по числу ядер
+    shutdown_drain_timeout: float = 20.0  # секунд на завершение регистраций при остановке
+    # Anti-spam
+    antispam_secret: Optional[str] = None  # по умолчанию используется admin_sync_token
+    antispam_require_form_token: bool = False
+    # Tournament cache
+    tournament_cache_size: int = 512
+    tournament_cache_ttl: float = 30.0  # секунд, пока запись свежая
+    tournament_cache_stale_ttl: float = 300.0  # секунд, пока устаревшая отдается с фоновым обновлением
+    cache_redis_url: Optional[str] = None  # общий кэш для всех воркеров (нужен пакет redis)
     # Google Sheets Integration
     google_sheets_enabled: bool = True
     google_sheets_credentials_file: Optional[str] = "start-loft-cb70bbfaa5b7.json"
@@ -1,29 +1,49 @@
+import asyncio
+import logging
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from config import settings
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 class Database:
     client: Optional[AsyncIOMotorClient] = None
     db: Optional[AsyncIOMotorDatabase] = None
+    indexes_task: Optional[asyncio.Task] = None
 
     @classmethod
     async def connect(cls):
         """Подключение к MongoDB"""
         cls.client = AsyncIOMotorClient(settings.mongodb_uri)
         cls.db = cls.client[settings.database_name]
-        
-        # Создаём уникальный индекс для предотвращения дублей заявок
-        await cls.db.registrations.create_index(
-            [("tournament_id", 1), ("phone", 1)],
-            unique=True
-        )
-        
+
+        # Индексы создаются в фоне, чтобы не задерживать старт API
+        cls.indexes_task = asyncio.create_task(cls.ensure_indexes())
+
         print(f"✅ Подключено к MongoDB: {settings.database_name}")
 
+    @classmethod
+    async def ensure_indexes(cls):
+        """Создание индексов (идемпотентно, вне критического пути старта)"""
+        indexes = [
+            # Уникальный индекс для предотвращения дублей заявок
+            (cls.db.registrations, [("tournament_id", 1), ("phone", 1)]),
+            # Уникальный slug для человекочитаемых ссылок на турниры
+            (cls.db.tournaments, [("slug", 1)]),
+        ]
+        for collection, keys in indexes:
+            try:
+                await collection.create_index(keys, unique=True)
+            except Exception as e:
+                logger.error(f"Failed to create index {keys} on {collection.name}: {e}")
+
     @classmethod
     async def disconnect(cls):
         """Отключение от MongoDB"""
+        if cls.indexes_task and not cls.indexes_task.done():
+            cls.indexes_task.cancel()
+        cls.indexes_task = None
         if cls.client:
             cls.client.close()
             print("❌ Отключено от MongoDB")
@@ -0,0 +1,61 @@
+"""
+Устранение дублей slug у турниров перед созданием уникального индекса.
+
+Турниры, созданные до уникальности slug, могли получить одинаковые slug —
+тогда Database.ensure_indexes() не может построить индекс на tournaments.slug
+и только пишет ошибку в лог. Скрипт оставляет slug самому раннему турниру,
+остальным дописывает суффикс (`-2`, `-3`, ...) и создает индекс.
+
+    python dedupe_tournament_slugs.py --dry-run  # предпросмотр
+    python dedupe_tournament_slugs.py            # переименование и индекс
+"""
+
+import argparse
+from collections import defaultdict
+
+from pymongo import MongoClient
+
+from config import settings
+from slugs import slugify
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Устранение дублей slug турниров")
+    parser.add_argument("--dry-run", action="store_true", help="только показать изменения")
+    args = parser.parse_args()
+
+    client = MongoClient(settings.mongodb_uri)
+    collection = client[settings.database_name].tournaments
+
+    docs = list(collection.find({}, {"slug": 1, "title": 1}).sort("_id", 1))
+    taken = {doc.get("slug") for doc in docs}
+    by_slug = defaultdict(list)
+    for doc in docs:
+        by_slug[doc.get("slug")].append(doc)
+
+    renamed = 0
+    for slug, group in by_slug.items():
+        if len(group) < 2:
+            continue
+        # Самый ранний турнир (по _id) сохраняет slug
+        base = slugify(str(slug or "")) or "tournament"
+        for doc in group[1:]:
+            n = 2
+            while f"{base}-{n}" in taken:
+                n += 1
+            new_slug = f"{base}-{n}"
+            taken.add(new_slug)
+            print(f"{doc['_id']} «{doc.get('title')}»: {slug!r} -> {new_slug!r}")
+            if not args.dry_run:
+                collection.update_one({"_id": doc["_id"]}, {"$set": {"slug": new_slug}})
+            renamed += 1
+
+    print(f"Дублей переименовано: {renamed}{' (dry run)' if args.dry_run else ''}")
+    if not args.dry_run:
+        collection.create_index([("slug", 1)], unique=True)
+        print("✅ Уникальный индекс tournaments.slug создан")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -8,6 +9,7 @@ from typing import Optional, List
 import asyncio
 from datetime import datetime
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 
 from config import settings
 from database import Database, get_tournaments_collection, get_registrations_collection
@@ -16,21 +18,43 @@ from models import (
     Registration, 
     RegistrationCreate, 
     RegistrationResponse,
+    FormTokenResponse,
     ClubSettings
 )
-from google_sheets import append_registration_to_sheet
+from antispam import spam_filter
+from tournament_cache import create_tournament_cache
+from slugs import SlugIndex, slugify, is_object_id
+from google_sheets import (
+    schedule_registration_append,
+    flush_pending_writes,
+    warm_up_google_sheets_client,
+)
+from lifecycle import InFlightRegistrations
 
 # Rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
+# Кэш карточек турниров (свой в каждом воркере, опционально общий Redis)
+tournament_cache = create_tournament_cache()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifecycle events"""
     # Startup
     await Database.connect()
+    # Индекс slug -> id прогревается в фоне; до этого промахи идут в MongoDB
+    slug_warm_up = asyncio.create_task(SlugIndex.warm())
+    # Клиент Google Sheets поднимается в фоне, не задерживая первый ответ
+    sheets_warm_up = asyncio.create_task(warm_up_google_sheets_client())
     yield
-    # Shutdown
+    for task in (sheets_warm_up, slug_warm_up):
+        if not task.done():
+            task.cancel()
+    # Shutdown: дожидаемся начатых регистраций и их записей в Google Sheets
+    await InFlightRegistrations.drain(timeout=settings.shutdown_drain_timeout)
+    await flush_pending_writes(timeout=settings.shutdown_drain_timeout)
+    await tournament_cache.close()
     await Database.disconnect()
 
 
@@ -95,18 +119,53 @@ async def get_tournaments(status: Optional[str] = None):
 
 
 
-@app.get("/api/tournaments/{id}", response_model=Tournament)
-async def get_tournament_by_id(id: str):
-    """Получить турнир по ID"""
+@app.get("/api/tournaments/{id_or_slug}", response_model=Tournament)
+async def get_tournament_by_id(id_or_slug: str):
+    """Получить турнир по ID или slug"""
     collection = await get_tournaments_collection()
-    try:
-        tournament = await collection.find_one({"_id": ObjectId(id)})
-    except Exception:
-        raise HTTPException(status_code=404, detail="Турнир не найден")
-    
+
+    if is_object_id(id_or_slug):
+        tournament = await _get_cached_tournament(collection, id_or_slug)
+    else:
+        tournament = await _get_tournament_by_slug(collection, id_or_slug)
+
     if not tournament:
         raise HTTPException(status_code=404, detail="Турнир не найден")
-    
+
+    # Уже провалидирован при записи в кэш, повторно не прогоняем через response_model
+    return JSONResponse(content=tournament)
+
+
+async def _get_cached_tournament(collection, tournament_id: str) -> Optional[dict]:
+    async def load():
+        return _serialize_tournament(
+            await collection.find_one({"_id": ObjectId(tournament_id)})
+        )
+    return await tournament_cache.get(f"id:{tournament_id}", load)
+
+
+async def _get_tournament_by_slug(collection, slug: str) -> Optional[dict]:
+    tournament_id = SlugIndex.get(slug)
+    if tournament_id:
+        tournament = await _get_cached_tournament(collection, tournament_id)
+        if tournament and tournament.get("slug") == slug:
+            return tournament
+        # Турнир удален или slug изменен в обход API — запись индекса устарела
+        SlugIndex.discard(slug)
+
+    # Slug нет в индексе (например, турнир создан другим воркером)
+    async def load():
+        return _serialize_tournament(await collection.find_one({"slug": slug}))
+    tournament = await tournament_cache.get(f"slug:{slug}", load)
+    if tournament:
+        SlugIndex.add(tournament["slug"], tournament["_id"])
+    return tournament
+
+
+def _serialize_tournament(tournament: Optional[dict]) -> Optional[dict]:
+    """Документ MongoDB -> JSON-ответ модели Tournament"""
+    if not tournament:
+        return None
     # Преобразуем ObjectId в строку и даты к строке
     if tournament.get('_id'):
         tournament['_id'] = str(tournament['_id'])
@@ -115,8 +174,14 @@ async def get_tournament_by_id(id: str):
             tournament['dates']['start'] = tournament['dates']['start'].isoformat()
         if isinstance(tournament['dates'].get('end'), datetime):
             tournament['dates']['end'] = tournament['dates']['end'].isoformat()
-    
-    return tournament
+    return Tournament(**tournament).model_dump(mode="json", by_alias=True)
+
+
+@app.get("/api/registrations/form-token", response_model=FormTokenResponse)
+@limiter.limit("30/minute")
+async def get_registration_form_token(request: Request):
+    """Выдать токен времени заполнения формы регистрации"""
+    return FormTokenResponse(form_token=spam_filter.issue_token())
 
 
 @app.post("/api/registrations", response_model=RegistrationResponse)
@@ -126,11 +191,21 @@ async def create_registration(
     request: Request
 ):
     """Создать заявку на турнир"""
-    
+    async with InFlightRegistrations.track():
+        return await _process_registration(registration, request)
+
+
+async def _process_registration(
+    registration: RegistrationCreate,
+    request: Request
+) -> RegistrationResponse:
     # Получаем метаданные
     client_ip = request.client.host if request.client else None
     user_agent = request.headers.get("user-agent", "")
     
+    # Дешевый антиспам-фильтр до любых запросов к MongoDB
+    spam_filter.check(registration.phone, registration.tournament_id, registration.form_token)
+    
     # Получаем информацию о турнире
     tournaments_collection = await get_tournaments_collection()
     from bson import ObjectId
@@ -168,9 +243,11 @@ async def create_registration(
         registrations_collection = await get_registrations_collection()
         try:
             result = await registrations_collection.insert_one(registration_doc)
+            spam_filter.remember(registration.phone, registration.tournament_id)
             return str(result.inserted_id)
         except Exception as e:
             if "duplicate key error" in str(e):
+                spam_filter.remember(registration.phone, registration.tournament_id)
                 raise HTTPException(
                     status_code=400, 
                     detail="Вы уже зарегистрированы на этот турнир"
@@ -179,10 +256,10 @@ async def create_registration(
     
     registration_id = await save_to_mongo()
     
-    # Сохраняем в Google Sheets (не блокирует успех регистрации если произойдет ошибка)
+    # Сохраняем в Google Sheets в фоне (не блокирует успех регистрации если произойдет ошибка)
     try:
         registration_doc["_id"] = registration_id
-        await append_registration_to_sheet(
+        schedule_registration_append(
             registration_data=registration_doc,
             tournament_name=tournament.get("title")
         )
@@ -240,6 +317,18 @@ async def get_tournament_registrations(tournament_id: str):
     return public_registrations
 
 
+@app.get("/api/admin/antispam-stats")
+async def get_antispam_stats(x_admin_token: Optional[str] = Header(default=None)):
+    """
+    Счетчики антиспам-фильтра воркера, обработавшего запрос (требует X-Admin-Token).
+    Поле pid показывает, какого именно: при нескольких воркерах опрашивайте
+    эндпоинт до получения всех pid и суммируйте по последнему ответу каждого.
+    """
+    if x_admin_token != settings.admin_token:
+        raise HTTPException(status_code=401, detail="Неверный токен")
+    return spam_filter.stats()
+
+
 @app.get("/api/club-settings", response_model=ClubSettings)
 async def get_club_settings():
     """Получить настройки клуба (статичные значения)"""
@@ -274,8 +363,25 @@ async def create_tournament(tournament: dict = Body(...)):
     now = datetime.utcnow()
     tournament["created_at"] = now
     tournament["updated_at"] = now
+    title = tournament.get("title")
+    if not isinstance(title, str) or not title.strip():
+        raise HTTPException(status_code=400, detail="Ошибка валидации: title должен быть непустой строкой")
     if "slug" not in tournament:
-        tournament["slug"] = tournament["title"].lower().replace(" ", "-")
+        tournament["slug"] = slugify(title)
+    slug = tournament["slug"]
+    # Только строки в нормальной форме: иначе турнир недоступен по /api/tournaments/{slug}
+    if not isinstance(slug, str) or not slug or slugify(slug) != slug or is_object_id(slug):
+        raise HTTPException(status_code=400, detail="Некорректный slug турнира")
+    # Уникальный индекс может еще строиться или не построиться из-за старых дублей,
+    # поэтому для slug вне индекса проверяем базу явно
+    existing_id = SlugIndex.get(slug)
+    if not existing_id:
+        existing = await collection.find_one({"slug": slug}, {"_id": 1})
+        if existing:
+            existing_id = str(existing["_id"])
+            SlugIndex.add(slug, existing_id)
+    if existing_id:
+        raise HTTPException(status_code=409, detail=f"Турнир со slug '{slug}' уже существует")
     if "status" not in tournament:
         tournament["status"] = "draft"
     # Для валидации: подставляем временный _id только для Pydantic, не сохраняем в БД
@@ -289,7 +395,14 @@ async def create_tournament(tournament: dict = Body(...)):
     # Сохраняем в MongoDB без _id/id — Mongo сам сгенерирует
     to_save = t.dict(by_alias=True, exclude={"id"})
     to_save.pop("_id", None)
-    result = await collection.insert_one(to_save)
+    try:
+        result = await collection.insert_one(to_save)
+    except DuplicateKeyError:
+        # Slug занят турниром, которого еще нет в индексе этого воркера
+        raise HTTPException(status_code=409, detail=f"Турнир со slug '{t.slug}' уже существует")
+    SlugIndex.add(t.slug, str(result.inserted_id))
+    # Сбрасываем закэшированный турнир, ранее отвечавший на этот slug
+    await tournament_cache.invalidate({"slug": t.slug})
     return {"_id": str(result.inserted_id), "slug": t.slug, "title": t.title}
     # Сохраняем в MongoDB
     result = await collection.insert_one(t.dict(by_alias=True))
@@ -303,6 +416,7 @@ async def create_tournament(tournament: dict = Body(...)):
 
 
 if __name__ == "__main__":
+    # Режим разработки. В продакшене: gunicorn -c gunicorn_conf.py
     import uvicorn
     uvicorn.run(
         "fastapi_start_loft:app",
@@ -1,19 +1,21 @@
 """
 Google Sheets integration for saving tournament registrations.
+
+gspread и google-auth импортируются лениво при первом обращении к клиенту,
+чтобы импорт модуля не замедлял старт API.
 """
 
 import asyncio
 import logging
 from datetime import datetime, date
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set, TYPE_CHECKING
 from functools import lru_cache
 
-import gspread
-from google.oauth2.service_account import Credentials
-from gspread.exceptions import APIError, SpreadsheetNotFound
-
 from config import settings
 
+if TYPE_CHECKING:
+    import gspread
+
 logger = logging.getLogger(__name__)
 
 # Google Sheets API scopes
@@ -24,7 +26,7 @@ SCOPES = [
 
 
 @lru_cache(maxsize=1)
-def get_google_sheets_client() -> Optional[gspread.Client]:
+def get_google_sheets_client() -> Optional["gspread.Client"]:
     """
     Создает и кэширует Google Sheets клиент.
     
@@ -40,6 +42,9 @@ def get_google_sheets_client() -> Optional[gspread.Client]:
         return None
     
     try:
+        import gspread
+        from google.oauth2.service_account import Credentials
+
         credentials = Credentials.from_service_account_file(
             settings.google_sheets_credentials_file,
             scopes=SCOPES
@@ -93,6 +98,44 @@ async def append_registration_to_sheet(
         return False
 
 
+# Фоновые записи, которые нужно дождаться при остановке воркера
+_pending_writes: Set[asyncio.Task] = set()
+
+
+def schedule_registration_append(
+    registration_data: Dict[str, Any],
+    tournament_name: Optional[str] = None
+) -> Optional[asyncio.Task]:
+    """
+    Запускает запись в Google Sheets в фоне, не задерживая ответ клиенту.
+    Задача учитывается в flush_pending_writes().
+    """
+    if not settings.google_sheets_enabled:
+        return None
+    task = asyncio.create_task(
+        append_registration_to_sheet(registration_data, tournament_name)
+    )
+    _pending_writes.add(task)
+    task.add_done_callback(_pending_writes.discard)
+    return task
+
+
+async def flush_pending_writes(timeout: float) -> int:
+    """
+    Дожидается незавершенных фоновых записей.
+
+    Returns:
+        int: количество записей, не успевших завершиться до таймаута
+    """
+    if not _pending_writes:
+        return 0
+    logger.info(f"Flushing {len(_pending_writes)} pending Google Sheets writes")
+    _, pending = await asyncio.wait(set(_pending_writes), timeout=timeout)
+    if pending:
+        logger.error(f"{len(pending)} Google Sheets writes did not finish before shutdown")
+    return len(pending)
+
+
 def _sync_append_to_sheet(
     registration_data: Dict[str, Any],
     tournament_name: Optional[str] = None
@@ -101,6 +144,8 @@ def _sync_append_to_sheet(
     Синхронная функция для добавления данных в Google Sheets.
     Вызывается через run_in_executor.
     """
+    from gspread.exceptions import APIError, SpreadsheetNotFound
+
     try:
         client = get_google_sheets_client()
         if not client:
@@ -212,3 +257,17 @@ async def test_google_sheets_connection() -> bool:
     except Exception as e:
         logger.error(f"Google Sheets connection test failed: {e}")
         return False
+
+
+async def warm_up_google_sheets_client() -> None:
+    """
+    Инициализирует клиент в фоне после старта, чтобы первая регистрация
+    не платила за импорт gspread и авторизацию сервисного аккаунта.
+    """
+    if not settings.google_sheets_enabled:
+        return
+    try:
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, get_google_sheets_client)
+    except Exception as e:
+        logger.error(f"Google Sheets client warm-up failed: {e}")
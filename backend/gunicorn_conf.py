@@ -0,0 +1,50 @@
+"""
+Продакшен-запуск API: gunicorn + uvicorn-воркеры.
+
+    gunicorn -c gunicorn_conf.py
+
+- Воркеров по числу ядер (или WORKERS из .env).
+- preload_app выключен: приложение и клиент Motor создаются в каждом
+  воркере уже после fork, соединения MongoDB не разделяются между процессами.
+- SIGTERM: воркеры перестают принимать соединения, дожидаются начатых
+  регистраций и фоновых записей в Google Sheets, затем закрывают MongoDB.
+- SIGHUP: rolling restart — мастер поднимает новые воркеры с новым кодом
+  и только потом плавно останавливает старые, сокет не закрывается.
+"""
+
+import multiprocessing
+import os
+
+from dotenv import dotenv_values
+
+# Модули приложения (config и др.) здесь не импортируются: конфиг исполняется
+# в мастере, и импортированный модуль остался бы в нем со старыми значениями
+# после SIGHUP. Нужные мастеру параметры читаются из окружения и .env напрямую.
+_dotenv = {key.upper(): value for key, value in dotenv_values(".env").items()}
+
+
+def _env(name: str, default: str) -> str:
+    return os.environ.get(name) or _dotenv.get(name) or default
+
+
+wsgi_app = "fastapi_start_loft:app"
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = f"{_env('HOST', '0.0.0.0')}:{_env('PORT', '8000')}"
+workers = int(_env("WORKERS", "0")) or multiprocessing.cpu_count()
+preload_app = False
+
+# Слив регистраций и затем записей в Sheets, плюс запас на закрытие соединений
+graceful_timeout = int(float(_env("SHUTDOWN_DRAIN_TIMEOUT", "20")) * 2) + 10
+timeout = 60
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    server.log.info(f"Worker {worker.pid} started")
+
+
+def worker_exit(server, worker):
+    server.log.info(f"Worker {worker.pid} stopped")
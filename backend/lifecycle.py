@@ -0,0 +1,54 @@
+"""
+Учет незавершенных регистраций для корректной остановки воркера.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class InFlightRegistrations:
+    """Счетчик регистраций, которые обрабатываются в текущем процессе"""
+    count: int = 0
+    _idle: asyncio.Event = None
+
+    @classmethod
+    def _idle_event(cls) -> asyncio.Event:
+        if cls._idle is None:
+            cls._idle = asyncio.Event()
+            cls._idle.set()
+        return cls._idle
+
+    @classmethod
+    @asynccontextmanager
+    async def track(cls):
+        """Оборачивает обработку одной регистрации"""
+        idle = cls._idle_event()
+        cls.count += 1
+        idle.clear()
+        try:
+            yield
+        finally:
+            cls.count -= 1
+            if cls.count == 0:
+                idle.set()
+
+    @classmethod
+    async def drain(cls, timeout: float) -> bool:
+        """
+        Ждет завершения всех регистраций.
+
+        Returns:
+            bool: True если все регистрации завершились до таймаута
+        """
+        if cls.count == 0:
+            return True
+        logger.info(f"Waiting for {cls.count} in-flight registrations")
+        try:
+            await asyncio.wait_for(cls._idle_event().wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Drain timed out with {cls.count} registrations in flight")
+            return False
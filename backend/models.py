@@ -81,6 +81,7 @@ class RegistrationCreate(BaseModel):
     comment: Optional[str] = None
     consent: bool = True
     honeypot: Optional[str] = None  # Антиспам поле (должно быть пустым)
+    form_token: Optional[str] = None  # Токен времени заполнения формы
 
     @validator('birth_date')
     def validate_age(cls, v):
@@ -139,6 +140,10 @@ class RegistrationResponse(BaseModel):
     registration_id: Optional[str] = None
 
 
+class FormTokenResponse(BaseModel):
+    form_token: str
+
+
 class ClubSettings(BaseModel):
     club_name: str
     city: str
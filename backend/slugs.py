@@ -0,0 +1,54 @@
+"""
+Индекс slug -> id турнира в памяти процесса.
+
+Прогревается при старте и обновляется при создании турниров, поэтому
+человекочитаемые ссылки разрешаются без запроса в MongoDB. Турниры,
+созданные другим воркером, подхватываются при первом промахе.
+"""
+
+import logging
+import re
+from typing import Dict, Optional
+
+from bson import ObjectId
+
+from database import get_tournaments_collection
+
+logger = logging.getLogger(__name__)
+
+
+def slugify(text: str) -> str:
+    """`Кубок Start Loft 2026!` -> `кубок-start-loft-2026`"""
+    text = re.sub(r"[^\w\s-]", "", text.lower())
+    return re.sub(r"[\s_-]+", "-", text).strip("-")
+
+
+def is_object_id(value: str) -> bool:
+    return ObjectId.is_valid(value)
+
+
+class SlugIndex:
+    ids: Dict[str, str] = {}
+
+    @classmethod
+    async def warm(cls):
+        """Загрузка всех slug одним запросом с проекцией"""
+        try:
+            collection = await get_tournaments_collection()
+            docs = await collection.find({}, {"slug": 1}).to_list(length=None)
+            cls.ids.update({doc["slug"]: str(doc["_id"]) for doc in docs if doc.get("slug")})
+            logger.info(f"Slug index warmed: {len(cls.ids)} tournaments")
+        except Exception as e:
+            logger.error(f"Failed to warm slug index: {e}")
+
+    @classmethod
+    def get(cls, slug: str) -> Optional[str]:
+        return cls.ids.get(slug)
+
+    @classmethod
+    def add(cls, slug: str, tournament_id: str):
+        cls.ids[slug] = tournament_id
+
+    @classmethod
+    def discard(cls, slug: str):
+        cls.ids.pop(slug, None)
@@ -0,0 +1,258 @@
+"""
+Двухуровневый кэш карточек турниров.
+
+- L1: LRU в памяти процесса с ограничением размера.
+- L2: общий Redis для всех воркеров (необязателен, включается CACHE_REDIS_URL).
+
+Запись свежая `ttl` секунд, затем еще `stale_ttl` секунд отдается
+устаревшей с фоновым обновлением (stale-while-revalidate). Параллельные
+промахи по одному ключу объединяются внутри воркера; с Redis — и между
+воркерами: загружает тот, кто взял lock, остальные ждут запись в Redis.
+Если турнир исчез из базы, его записи удаляются из кэша.
+"""
+
+import asyncio
+import json
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+# Снимаем lock, только если он все еще наш (мог истечь и достаться другому)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisTier:
+    """Общий уровень кэша; ошибки Redis не ломают запрос"""
+
+    def __init__(self, url: str, prefix: str = "startloft:tournament:"):
+        # redis — необязательная зависимость, импортируется только если настроен
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        try:
+            raw = await self.client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Redis cache get failed: {e}")
+            return None
+        if raw is None:
+            return None
+        try:
+            data = json.loads(raw)
+            return data["value"], float(data["stored_at"])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Corrupt Redis cache entry {key}: {e}")
+            return None
+
+    async def set(self, key: str, value: Dict[str, Any], stored_at: float, expire: float) -> None:
+        try:
+            await self.client.set(
+                self.prefix + key,
+                json.dumps({"value": value, "stored_at": stored_at}),
+                ex=max(1, int(expire))
+            )
+        except Exception as e:
+            logger.warning(f"Redis cache set failed: {e}")
+
+    async def acquire_lock(self, key: str, token: str, ttl_ms: int) -> bool:
+        """SET NX PX; при ошибке Redis считаем lock взятым и грузим сами"""
+        try:
+            return bool(await self.client.set(self.prefix + "lock:" + key, token, nx=True, px=ttl_ms))
+        except Exception as e:
+            logger.warning(f"Redis lock acquire failed: {e}")
+            return True
+
+    async def release_lock(self, key: str, token: str) -> None:
+        try:
+            await self.client.eval(RELEASE_LOCK_SCRIPT, 1, self.prefix + "lock:" + key, token)
+        except Exception as e:
+            logger.warning(f"Redis lock release failed: {e}")
+
+    async def is_locked(self, key: str) -> bool:
+        try:
+            return bool(await self.client.exists(self.prefix + "lock:" + key))
+        except Exception as e:
+            logger.warning(f"Redis lock check failed: {e}")
+            return False
+
+    async def delete(self, *keys: str) -> None:
+        try:
+            await self.client.delete(*(self.prefix + key for key in keys))
+        except Exception as e:
+            logger.warning(f"Redis cache delete failed: {e}")
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+class TournamentCache:
+    """Кэш сериализованных турниров по ключам `id:<id>` и `slug:<slug>`"""
+
+    def __init__(
+        self,
+        max_size: int = 512,
+        ttl: float = 30.0,
+        stale_ttl: float = 300.0,
+        shared: Optional[RedisTier] = None,
+        lock_ttl: float = 5.0,
+        lock_poll_interval: float = 0.05,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.shared = shared
+        self.lock_ttl = lock_ttl
+        self.lock_poll_interval = lock_poll_interval
+        # ключ -> (значение, время записи по time.time())
+        self._local: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def keys_for(value: Dict[str, Any]) -> Tuple[str, ...]:
+        keys = []
+        if value.get("_id"):
+            keys.append(f"id:{value['_id']}")
+        if value.get("slug"):
+            keys.append(f"slug:{value['slug']}")
+        return tuple(keys)
+
+    async def get(self, key: str, loader: Loader) -> Optional[Dict[str, Any]]:
+        """
+        Возвращает турнир из кэша или через loader.
+        None (турнир не найден) не кэшируется и удаляет прежние записи.
+        """
+        entry = self._get_local(key)
+        if entry is None and self.shared:
+            entry = await self.shared.get(key)
+            if entry is not None:
+                self._set_local(key, *entry)
+
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            if age <= self.ttl:
+                return value
+            if age <= self.ttl + self.stale_ttl:
+                self._revalidate(key, loader)
+                return value
+
+        return await self._load(key, loader)
+
+    async def _load(self, key: str, loader: Loader) -> Optional[Dict[str, Any]]:
+        """Загрузка с объединением параллельных запросов по ключу"""
+        # shield: отмена одного ожидающего не отменяет загрузку для остальных
+        return await asyncio.shield(self._start_load(key, loader))
+
+    def _revalidate(self, key: str, loader: Loader) -> None:
+        self._start_load(key, loader)
+
+    def _start_load(self, key: str, loader: Loader) -> asyncio.Task:
+        """Одна задача загрузки на ключ, общая для всех ожидающих"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._on_loaded(key, done))
+        return task
+
+    async def _fetch(self, key: str, loader: Loader) -> Optional[Dict[str, Any]]:
+        if not self.shared:
+            return await self._fetch_from_source(key, loader)
+
+        token = secrets.token_hex(8)
+        deadline = time.monotonic() + self.lock_ttl
+        while not await self.shared.acquire_lock(key, token, int(self.lock_ttl * 1000)):
+            # Другой воркер уже грузит этот ключ — ждем его запись в Redis
+            await asyncio.sleep(self.lock_poll_interval)
+            entry = await self.shared.get(key)
+            if entry is not None and time.time() - entry[1] <= self.ttl:
+                self._set_local(key, *entry)
+                return entry[0]
+            if time.monotonic() > deadline:
+                break
+        try:
+            return await self._fetch_from_source(key, loader)
+        finally:
+            await self.shared.release_lock(key, token)
+
+    async def _fetch_from_source(self, key: str, loader: Loader) -> Optional[Dict[str, Any]]:
+        value = await loader()
+        if value is not None:
+            await self.set(value)
+            return value
+        # Турнира больше нет: не отдаем удаленный документ до конца stale_ttl
+        old = self._local.get(key)
+        keys = {key, *self.keys_for(old[0])} if old else {key}
+        await self._drop(*keys)
+        return None
+
+    def _on_loaded(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Забираем исключение, даже если ожидающих не осталось (фоновое обновление)
+        if not task.cancelled() and task.exception():
+            logger.warning(f"Tournament cache load failed for {key}: {task.exception()}")
+
+    async def set(self, value: Dict[str, Any]) -> None:
+        stored_at = time.time()
+        for key in self.keys_for(value):
+            self._set_local(key, value, stored_at)
+            if self.shared:
+                await self.shared.set(key, value, stored_at, self.ttl + self.stale_ttl)
+
+    async def invalidate(self, value: Dict[str, Any]) -> None:
+        await self._drop(*self.keys_for(value))
+
+    async def _drop(self, *keys: str) -> None:
+        for key in keys:
+            self._local.pop(key, None)
+        if self.shared and keys:
+            await self.shared.delete(*keys)
+
+    def _get_local(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        entry = self._local.get(key)
+        if entry is not None:
+            self._local.move_to_end(key)
+        return entry
+
+    def _set_local(self, key: str, value: Dict[str, Any], stored_at: float) -> None:
+        self._local[key] = (value, stored_at)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    async def close(self) -> None:
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self.shared:
+            await self.shared.close()
+
+
+def create_tournament_cache() -> TournamentCache:
+    shared = None
+    if settings.cache_redis_url:
+        try:
+            shared = RedisTier(settings.cache_redis_url)
+        except ImportError:
+            logger.warning("CACHE_REDIS_URL is set but redis is not installed, using local cache only")
+    return TournamentCache(
+        max_size=settings.tournament_cache_size,
+        ttl=settings.tournament_cache_ttl,
+        stale_ttl=settings.tournament_cache_stale_ttl,
+        shared=shared,
+    )
@@ -1,5 +1,6 @@
 "use client";
-import React, { useState } from "react";
+import React, { useCallback, useEffect, useState } from "react";
+import { api } from "@/lib/api";
 
 const RANKS = [
   { value: "КМС", label: "КМС (Кандидат в мастера спорта)" },
@@ -36,6 +37,16 @@ export default function RegistrationPopup({ open, onClose, onSuccess, tournament
   });
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState("");
+  const [formToken, setFormToken] = useState<string | undefined>();
+
+  // Токен времени заполнения формы для антиспам-фильтра (одноразовый)
+  const refreshFormToken = useCallback(() => {
+    api.getFormToken().then(setFormToken).catch(() => {});
+  }, []);
+
+  useEffect(() => {
+    if (open) refreshFormToken();
+  }, [open, refreshFormToken]);
 
   const handleChange = (e: React.ChangeEvent<HTMLInputElement | HTMLSelectElement>) => {
     setForm({ ...form, [e.target.name]: e.target.value });
@@ -66,7 +77,8 @@ export default function RegistrationPopup({ open, onClose, onSuccess, tournament
       city_country: form.city + ", " + form.country,
       consent: true,
       honeypot: "",
-      tournament_id: form.tournament_id
+      tournament_id: form.tournament_id,
+      form_token: formToken
     };
     try {
       const res = await fetch(`${apiBase}/api/registrations`, {
@@ -88,6 +100,7 @@ export default function RegistrationPopup({ open, onClose, onSuccess, tournament
         } else {
           setError(detailMessage || "Ошибка отправки. Попробуйте позже.");
         }
+        refreshFormToken();
         return;
       }
       const data = await res.json().catch(() => ({}));
@@ -122,6 +135,7 @@ export default function RegistrationPopup({ open, onClose, onSuccess, tournament
       onSuccess();
       onClose();
     } catch (err: any) {
+      refreshFormToken();
       setError(err.message || "Ошибка");
     } finally {
       setLoading(false);
@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useCallback, useState, useEffect } from 'react';
 import { api } from '@/lib/api';
 import { Tournament } from '@/types';
 import { useRouter } from 'next/navigation';
@@ -36,6 +36,16 @@ export default function RegistrationPage() {
     honeypot: "",
     tournament_id: ""
   });
+  const [formToken, setFormToken] = useState<string | undefined>();
+
+  // Токен времени заполнения формы для антиспам-фильтра (одноразовый)
+  const refreshFormToken = useCallback(() => {
+    api.getFormToken().then(setFormToken).catch(() => {});
+  }, []);
+
+  useEffect(() => {
+    refreshFormToken();
+  }, [refreshFormToken]);
 
   useEffect(() => {
     api.getTournaments('published').then(data => {
@@ -75,7 +85,8 @@ export default function RegistrationPage() {
       city_country: form.city + ", " + form.country,
       consent: true,
       honeypot: "",
-      tournament_id: form.tournament_id
+      tournament_id: form.tournament_id,
+      form_token: formToken
     };
 
     try {
@@ -99,6 +110,7 @@ export default function RegistrationPage() {
         } else {
           setError(detailMessage || "Ошибка отправки. Попробуйте позже.");
         }
+        refreshFormToken();
         setLoading(false);
         return;
       }
@@ -108,6 +120,7 @@ export default function RegistrationPage() {
       // Переходим на главную с параметром success
       router.push('/?registered=true&whatsapp=' + encodeURIComponent(data.whatsapp_link || ''));
     } catch (err) {
+      refreshFormToken();
       setError("Ошибка соединения");
       setLoading(false);
     }
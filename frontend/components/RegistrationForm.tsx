@@ -1,6 +1,6 @@
 'use client';
 
-import { useState } from 'react';
+import { useCallback, useEffect, useState } from 'react';
 import { Tournament, RegistrationForm } from '@/types';
 import { normalizePhone } from '@/lib/utils';
 import { api } from '@/lib/api';
@@ -26,6 +26,16 @@ export default function RegistrationFormComponent({ tournaments, initialTourname
   });
   const [country, setCountry] = useState('Казахстан');
   const [city, setCity] = useState('');
+  const [formToken, setFormToken] = useState<string | undefined>();
+
+  // Токен времени заполнения формы для антиспам-фильтра (одноразовый)
+  const refreshFormToken = useCallback(() => {
+    api.getFormToken().then(setFormToken).catch(() => {});
+  }, []);
+
+  useEffect(() => {
+    refreshFormToken();
+  }, [refreshFormToken]);
 
   // Маска для телефона +7 (XXX) XXX-XX-XX
   const handlePhoneChange = (value: string) => {
@@ -55,10 +65,14 @@ export default function RegistrationFormComponent({ tournaments, initialTourname
         birth_date: formData.birthDate,
         phone: normalizePhone(formData.phone),
         city_country: `${city}, ${country}`,
+        form_token: formToken,
       };
 
       const response = await api.createRegistration(normalizedData);
       
+      // Токен израсходован, берем новый для следующей заявки
+      refreshFormToken();
+
       // Показываем уведомление успеха
       setLoading(false);
       setShowSuccess(true);
@@ -89,6 +103,7 @@ export default function RegistrationFormComponent({ tournaments, initialTourname
       }, 3000);
       
     } catch (err: any) {
+      refreshFormToken();
       setError(err.message || 'Произошла ошибка при регистрации');
       setLoading(false);
     }
@@ -28,6 +28,13 @@ export const api = {
     return res.json();
   },
 
+  async getFormToken(): Promise<string | undefined> {
+    const res = await fetch(`${API_URL}/api/registrations/form-token`, { cache: 'no-store' });
+    if (!res.ok) return undefined;
+    const data = await res.json();
+    return data.form_token;
+  },
+
   async createRegistration(data: any) {
     const res = await fetch(`${API_URL}/api/registrations`, {
       method: 'POST',
@@ -59,6 +59,7 @@ export interface RegistrationForm {
   comment?: string;
   consent: boolean;
   honeypot?: string;
+  form_token?: string;
 }
 
 export interface RegistrationResponse {
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Cold-start бенчмарк backend: время от запуска процесса uvicorn
+до первого ответа 200 на `GET /`.
+
+Пример:
+    python scripts/bench_cold_start.py --runs 5
+    python scripts/bench_cold_start.py --python backend/venv/bin/python --path /api/tournaments
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(ROOT_DIR, "backend")
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_once(python_bin: str, path: str, timeout: float) -> float:
+    """Запускает сервер и возвращает секунды до первого 200"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}{path}"
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [python_bin, "-m", "uvicorn", "fastapi_start_loft:app",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        while True:
+            elapsed = time.perf_counter() - started
+            if elapsed > timeout:
+                raise TimeoutError(f"Нет ответа 200 за {timeout:.0f} с")
+            if proc.poll() is not None:
+                stderr = proc.stderr.read().decode(errors="replace")
+                raise RuntimeError(f"Сервер завершился с кодом {proc.returncode}:\n{stderr}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as resp:
+                    if resp.status == 200:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError, socket.timeout):
+                pass
+            time.sleep(0.01)
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cold-start бенчмарк Start Loft API")
+    parser.add_argument("--runs", type=int, default=5, help="количество запусков")
+    parser.add_argument("--python", default=sys.executable, help="интерпретатор с зависимостями backend")
+    parser.add_argument("--path", default="/", help="эндпоинт, ожидающий 200")
+    parser.add_argument("--timeout", type=float, default=30.0, help="таймаут одного запуска, с")
+    args = parser.parse_args()
+
+    results = []
+    for i in range(args.runs):
+        seconds = measure_once(args.python, args.path, args.timeout)
+        results.append(seconds)
+        print(f"run {i + 1}: {seconds * 1000:.1f} ms")
+
+    print(
+        f"time-to-first-200 {args.path}: "
+        f"min {min(results) * 1000:.1f} ms, "
+        f"median {statistics.median(results) * 1000:.1f} ms, "
+        f"max {max(results) * 1000:.1f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,6 +19,8 @@ NPM_BIN="${NPM_BIN:-npm}"
 
 BACKEND_SERVICE="${BACKEND_SERVICE:-}"
 FRONTEND_SERVICE="${FRONTEND_SERVICE:-}"
+# reload — rolling restart gunicorn (SIGHUP через ExecReload), restart — полный перезапуск
+BACKEND_RESTART_ACTION="${BACKEND_RESTART_ACTION:-restart}"
 SYSTEMCTL_CMD="${SYSTEMCTL_CMD:-systemctl}"
 SUDO="${SUDO:-}"
 
@@ -40,7 +42,7 @@ echo "==> Frontend dependencies and build"
 if [ -n "$BACKEND_SERVICE" ] || [ -n "$FRONTEND_SERVICE" ]; then
   echo "==> Restarting services"
   if [ -n "$BACKEND_SERVICE" ]; then
-    $SUDO $SYSTEMCTL_CMD restart "$BACKEND_SERVICE"
+    $SUDO $SYSTEMCTL_CMD "$BACKEND_RESTART_ACTION" "$BACKEND_SERVICE"
   fi
   if [ -n "$FRONTEND_SERVICE" ]; then
     $SUDO $SYSTEMCTL_CMD restart "$FRONTEND_SERVICE"